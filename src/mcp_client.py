@@ -3,11 +3,19 @@ MCP Client for communicating with AdCP Creative Agent.
 Handles MCP protocol requests and responses with async status polling.
 """
 
-import json
+import asyncio
+import math
+import random
+import secrets
+import threading
 import time
-import uuid
-from typing import Dict, Any, Optional, List
-import requests
+import weakref
+from typing import (
+    Dict, Any, Optional, List, Callable, Coroutine, Mapping, Tuple, TypeVar
+)
+import httpx
+import ijson
+import orjson
 
 try:
     from utils.logger import get_logger
@@ -16,16 +24,191 @@ except ImportError:
 
 logger = get_logger()
 
+T = TypeVar("T")
+
+# Called with each creative format as soon as it has been decoded
+FormatHook = Callable[[Dict[str, Any]], None]
+
+# Creative format catalogs shared by all clients: agent_url -> (fetched_at, formats)
+_formats_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+
+# Keep-alive HTTP/2 pools shared by all clients addressing the same agent.
+# Async clients are bound to the event loop that opened them, so pools are
+# kept per loop: loop -> agent_url -> client.
+_server_sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+
+# In-flight limits shared by all clients calling the same tool on the same
+# agent with the same limit, kept per loop like the pools:
+# loop -> (agent_url, tool_name, limit) -> gate.
+_inflight_gates: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Sync wrappers all run on one long-lived background loop, so their pools
+# survive between calls instead of being rebuilt for each one
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+# Every MCP request body is JSON, so pooled clients send this by default
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Bodies at least this large (or of unknown size) are decoded incrementally
+STREAM_DECODE_MIN_BYTES = 256 * 1024
+
+# ijson prefix of each entry in a tool result's format list
+_FORMAT_ITEM_PREFIX = "result.formats.item"
+
+# Minimum seconds between "Poll result" log lines for a pending operation
+POLL_LOG_INTERVAL = 5.0
+
+
+def _get_session(agent_url: str) -> httpx.AsyncClient:
+    """Return the pooled async client for agent_url on the running loop."""
+    sessions = _server_sessions.setdefault(asyncio.get_running_loop(), {})
+    client = sessions.get(agent_url)
+
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=True,
+            limits=_POOL_LIMITS,
+            timeout=30,
+            headers=_JSON_HEADERS,
+        )
+        sessions[agent_url] = client
+
+    return client
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop the sync wrappers submit work to."""
+    global _sync_loop
+
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="mcp-client-loop",
+                daemon=True,
+            ).start()
+            _sync_loop = loop
+
+    return _sync_loop
+
+
+class _AsyncBodyReader:
+    """Async file-like view of a streamed response body, as ijson expects."""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+def _json_object(document: Any) -> Dict[str, Any]:
+    """Return a decoded document, rejecting anything but a JSON object."""
+    if not isinstance(document, dict):
+        raise orjson.JSONDecodeError("Expected a JSON object", "", 0)
+    return document
+
+
+def _each_format(data: Dict[str, Any], on_format: FormatHook) -> None:
+    """Call on_format for every entry of data's result.formats."""
+    result = data.get("result")
+    if isinstance(result, dict):
+        for fmt in result.get("formats") or ():
+            if isinstance(fmt, dict):
+                on_format(fmt)
+
+
+async def _read_json(
+    response: httpx.Response,
+    on_format: Optional[FormatHook] = None
+) -> Dict[str, Any]:
+    """
+    Decode the JSON body of a streamed response.
+
+    Large or unsized bodies are parsed with ijson as they arrive, so the raw
+    bytes are never held in memory, and each entry of result.formats is
+    handed to on_format while the rest is still downloading. Everything
+    else is read in one go and parsed with orjson.
+
+    Raises:
+        orjson.JSONDecodeError if the body is not a valid JSON object
+    """
+    try:
+        length = int(response.headers["content-length"])
+    except (KeyError, ValueError):
+        # Missing or malformed length—treat the body as unsized
+        length = None
+
+    if length is not None and length < STREAM_DECODE_MIN_BYTES:
+        data = _json_object(orjson.loads(await response.aread()))
+        if on_format is not None:
+            _each_format(data, on_format)
+        return data
+
+    builder = ijson.ObjectBuilder()
+    try:
+        async for prefix, event, value in ijson.parse_async(
+            _AsyncBodyReader(response), use_float=True
+        ):
+            builder.event(event, value)
+
+            # A format object just closed; it's the last one in the list
+            if (on_format is not None and event == "end_map"
+                    and prefix == _FORMAT_ITEM_PREFIX):
+                on_format(builder.value["result"]["formats"][-1])
+    except ijson.JSONError as e:
+        raise orjson.JSONDecodeError(str(e), "", 0) from e
+
+    if not hasattr(builder, "value"):
+        raise orjson.JSONDecodeError("Empty response body", "", 0)
+
+    return _json_object(builder.value)
+
+
+async def aclose_sessions() -> None:
+    """
+    Close every pooled client opened on the running event loop.
+
+    Async callers must await this before their event loop finishes (e.g.
+    at the end of the coroutine passed to asyncio.run); otherwise the
+    loop's pools and their sockets stay open until garbage collection.
+    Pools used by the sync wrappers live for the whole process.
+    """
+    sessions = _server_sessions.pop(asyncio.get_running_loop(), {})
+    for client in sessions.values():
+        await client.aclose()
+
 
 class MCPClient:
-    """Client for MCP protocol communication with Creative Agent."""
+    """
+    Client for MCP protocol communication with Creative Agent.
+
+    Connection pools are shared per event loop. Code that drives the async
+    methods on its own loop should await aclose_sessions() before that
+    loop ends.
+    """
 
     def __init__(
         self,
         agent_url: str,
         max_retries: int = 30,
         retry_delay: float = 2.0,
-        timeout: int = 300
+        timeout: int = 300,
+        min_delay: float = 0.2,
+        max_delay: float = 8.0,
+        backoff_rate: float = 1.5,
+        formats_ttl: float = 300,
+        max_inflight: int = 10,
+        tool_limits: Optional[Dict[str, int]] = None
     ):
         """
         Initialize MCP client.
@@ -33,24 +216,91 @@ class MCPClient:
         Args:
             agent_url: Base URL of the Creative Agent
             max_retries: Maximum times to poll before giving up
-            retry_delay: Seconds to wait between polls
+            retry_delay: Seconds to wait before the first poll
             timeout: Maximum total waiting time
+            min_delay: Lower bound for the wait between polls
+            max_delay: Upper bound for the backoff between polls; an
+                agent's own poll hint may ask for longer
+            backoff_rate: Factor the wait grows by after each pending poll
+            formats_ttl: Seconds a fetched format list is reused for
+            max_inflight: Maximum concurrent calls per tool, shared by all
+                clients of this agent that use the same limit
+            tool_limits: Per-tool overrides of max_inflight, keyed by tool name
+
+        Raises:
+            ValueError if max_inflight or a tool limit is below 1
         """
+        limits = [max_inflight, *(tool_limits or {}).values()]
+        if min(limits) < 1:
+            raise ValueError("In-flight limits must be at least 1")
+
         self.agent_url = agent_url.rstrip('/')
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.timeout = timeout
-        self.session = requests.Session()
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.backoff_rate = backoff_rate
+        self.formats_ttl = formats_ttl
+        self.max_inflight = max_inflight
+        self.tool_limits = tool_limits or {}
+        self._tools_endpoint = f"{self.agent_url}/mcp/tools"
+
+    @property
+    def _aclient(self) -> httpx.AsyncClient:
+        """Shared connection pool for this agent on the running event loop."""
+        return _get_session(self.agent_url)
+
+    def _inflight_gate(self, tool_name: str) -> asyncio.Semaphore:
+        """Semaphore limiting concurrent calls of tool_name on the running loop."""
+        gates = _inflight_gates.setdefault(asyncio.get_running_loop(), {})
+        limit = self.tool_limits.get(tool_name, self.max_inflight)
+        key = (self.agent_url, tool_name, limit)
+        gate = gates.get(key)
+
+        if gate is None:
+            gate = gates[key] = asyncio.Semaphore(limit)
+
+        return gate
 
     def _generate_context_id(self) -> str:
-        """Generate unique context ID for async tool calls."""
-        return str(uuid.uuid4())
+        """Generate unique context ID for async tool calls (32 hex chars)."""
+        return secrets.token_hex(16)
+
+    def _run_sync(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine to completion from synchronous code.
+
+        The coroutine runs on the shared background loop, so connection
+        pools are reused across calls, instances and threads. Callers on
+        another event loop (a notebook, an async handler) are blocked like
+        any sync call, as they were before the client went async.
+
+        Raises:
+            RuntimeError if called from the background loop itself
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        loop = _get_sync_loop()
+        if running is loop:
+            # Waiting on our own loop would never finish
+            coro.close()
+            raise RuntimeError(
+                "Sync MCPClient methods can't run on the client's own "
+                "event loop; use the async variants instead"
+            )
+
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
 
-    def _make_mcp_request(
+    async def _amake_mcp_request(
         self,
         tool_name: str,
         context_id: str,
-        input_data: Dict[str, Any]
+        input_data: Dict[str, Any],
+        on_format: Optional[FormatHook] = None
     ) -> Dict[str, Any]:
         """
         Generic MCP POST request to invoke a tool.
@@ -69,18 +319,15 @@ class MCPClient:
         }
 
         try:
-            endpoint = f"{self.agent_url}/mcp/tools"
-            logger.log_info(f"Making MCP request to {endpoint}")
-
-            response = self.session.post(
-                endpoint,
-                json=request_body,
-                headers={"Content-Type": "application/json"},
-                timeout=30,
-            )
-            response.raise_for_status()
+            logger.log_info(f"Making MCP request to {self._tools_endpoint}")
 
-            result = response.json()
+            async with self._aclient.stream(
+                "POST",
+                self._tools_endpoint,
+                content=orjson.dumps(request_body),
+            ) as response:
+                response.raise_for_status()
+                result = await _read_json(response, on_format)
 
             logger.log_mcp_call(
                 tool_name=tool_name,
@@ -92,7 +339,7 @@ class MCPClient:
 
             return result
 
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
             error_msg = f"MCP request failed: {str(e)}"
 
             logger.log_mcp_call(
@@ -106,11 +353,75 @@ class MCPClient:
             raise Exception(error_msg) from e
 
     
-    def _poll_until_complete(
+    @staticmethod
+    def _poll_hint(
+        headers: Mapping[str, str],
+        data: Dict[str, Any]
+    ) -> Optional[float]:
+        """
+        Read the agent's suggested wait before the next poll.
+
+        Checks the Retry-After header (in seconds) first, then a
+        poll_after_ms field in the response body.
+
+        Returns:
+            Seconds to wait, or None if the agent gave no usable hint
+        """
+        for value, scale in (
+            (headers.get("retry-after"), 1),
+            (data.get("poll_after_ms"), 1000),
+        ):
+            try:
+                seconds = float(value) / scale
+            except (TypeError, ValueError):
+                continue
+
+            # Ignore "inf"/"nan" rather than sleeping forever
+            if math.isfinite(seconds):
+                return max(0.0, seconds)
+
+        return None
+
+    @staticmethod
+    def _terminal(
+        data: Dict[str, Any]
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Check whether a status payload ends the operation.
+
+        Returns:
+            (True, data) if completed, (False, None) if still pending
+
+        Raises:
+            Exception if the operation failed
+        """
+        status = data.get("status")
+
+        if status == "completed":
+            return True, data
+
+        if status == "failed":
+            raise Exception(data.get("error", "Operation failed"))
+
+        return False, None
+
+    @staticmethod
+    async def _client_error_message(response: httpx.Response) -> str:
+        """Pull the agent's error message out of a 4xx response."""
+        try:
+            error = orjson.loads(await response.aread()).get("error")
+        except (orjson.JSONDecodeError, AttributeError):
+            error = None
+
+        return error or f"Polling failed with HTTP {response.status_code}"
+
+    async def _poll_until_complete(
         self,
         tool_name: str,
         context_id: str,
-        initial_response: Dict[str, Any]
+        initial_response: Dict[str, Any],
+        deadline: Optional[float] = None,
+        on_format: Optional[FormatHook] = None
     ) -> Dict[str, Any]:
         """
         Poll the operation_url returned by the agent until the task completes.
@@ -119,6 +430,9 @@ class MCPClient:
             tool_name: The tool being executed
             context_id: The unique async operation identifier
             initial_response: First response returned by MCP
+            deadline: time.time() by which to give up; defaults to timeout
+                seconds from now
+            on_format: Called with each format of the final result
 
         Returns:
             Final completed JSON response
@@ -132,60 +446,172 @@ class MCPClient:
         if not operation_url:
             raise Exception("No operation_url returned by agent")
 
-        status = initial_response.get("status", "unknown")
-
-        # If immediately completed
-        if status == "completed":
-            return initial_response
-
-        if status == "failed":
-            raise Exception(initial_response.get("error", "Operation failed"))
+        # If immediately completed (or failed)
+        done, result = self._terminal(initial_response)
+        if done:
+            return result
 
         logger.log_info(f"Starting polling at {operation_url}")
 
-        start_time = time.time()
+        if deadline is None:
+            deadline = time.time() + self.timeout
+        last_log = 0.0
+        delay = max(self.min_delay, self.retry_delay)
+        hint = self._poll_hint({}, initial_response)
 
         # Poll until finished or timeout
         while True:
 
             # Check global timeout
-            if time.time() - start_time > self.timeout:
+            remaining = deadline - time.time()
+            if remaining < 0:
                 raise Exception("Operation timed out")
 
-            time.sleep(self.retry_delay)
+            # Prefer the agent's own estimate of when to poll next, bounded so
+            # it can't fall below min_delay or outlast the timeout; otherwise
+            # back off, with jitter so many clients don't poll in lockstep.
+            if hint is not None:
+                wait = max(self.min_delay, min(hint, remaining))
+                delay = self.min_delay
+            else:
+                wait = min(delay + random.uniform(0, 0.25 * delay), remaining)
+                delay = min(self.max_delay, delay * self.backoff_rate)
+
+            # Yield to the event loop instead of blocking the thread
+            await asyncio.sleep(wait)
+            hint = None
 
             try:
                 # Poll by GET request
-                response = self.session.get(operation_url, timeout=30)
-                response.raise_for_status()
-                data = response.json()
+                async with self._aclient.stream(
+                    "GET", operation_url
+                ) as response:
+                    if (response.is_client_error
+                            and response.status_code != 429):
+                        # Client errors won't clear up by retrying
+                        raise Exception(
+                            await self._client_error_message(response)
+                        )
+                    response.raise_for_status()
+                    data = await _read_json(response, on_format)
+
+            except (
+                httpx.RequestError,
+                httpx.HTTPStatusError,
+                orjson.JSONDecodeError,
+            ) as e:
+                # Transport and server errors are transient—keep polling,
+                # waiting as long as a 429/503 asks us to
+                logger.log_warning(f"Polling error: {str(e)}")
+                if isinstance(e, httpx.HTTPStatusError):
+                    hint = self._poll_hint(e.response.headers, {})
+                continue
 
+            hint = self._poll_hint(response.headers, data)
+
+            # Log pending polls at most once per interval; always log the end
+            status = data.get("status")
+            now = time.monotonic()
+            if (status in ("completed", "failed")
+                    or now - last_log >= POLL_LOG_INTERVAL):
                 logger.log_info(
-                    f"Poll result: status={data.get('status')} "
+                    f"Poll result: status={status} "
                     f"context_id={context_id}"
                 )
+                last_log = now
+
+            # Terminal states end polling; a failure propagates immediately
+            done, result = self._terminal(data)
+            if done:
+                return result
 
-                if data.get("status") == "completed":
-                    return data
+    async def _stream_until_complete(
+        self,
+        tool_name: str,
+        context_id: str,
+        initial_response: Dict[str, Any],
+        on_format: Optional[FormatHook] = None
+    ) -> Dict[str, Any]:
+        """
+        Follow the agent's Server-Sent Events stream until the task completes.
 
-                if data.get("status") == "failed":
-                    raise Exception(data.get("error", "Operation failed"))
+        The agent holds the connection open and pushes each status change, so
+        no poll round-trips are needed. Falls back to polling if the stream
+        breaks or ends early.
 
-            except Exception as e:
-                # Do NOT crash—continue polling gracefully
-                logger.log_warning(f"Polling error: {str(e)}")
-                continue
+        Args:
+            tool_name: The tool being executed
+            context_id: The unique async operation identifier
+            initial_response: First response returned by MCP
+            on_format: Called with each format of the final result
+
+        Returns:
+            Final completed JSON response
+
+        Raises:
+            Exception if failed or timed out
+        """
+        events_url = initial_response["events_url"]
+        deadline = time.time() + self.timeout
+        logger.log_info(f"Streaming status events from {events_url}")
+
+        async def follow() -> Optional[Dict[str, Any]]:
+            async with self._aclient.stream(
+                "GET",
+                events_url,
+                timeout=httpx.Timeout(30, read=None),
+            ) as response:
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+
+                    data = _json_object(orjson.loads(line[len("data:"):]))
+
+                    logger.log_info(
+                        f"Stream event: status={data.get('status')} "
+                        f"context_id={context_id}"
+                    )
+
+                    done, result = self._terminal(data)
+                    if done:
+                        if on_format is not None:
+                            _each_format(result, on_format)
+                        return result
+
+            return None
+
+        try:
+            result = await asyncio.wait_for(follow(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            raise Exception("Operation timed out")
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.log_warning(f"Event stream error: {str(e)}")
+            result = None
+
+        if result is not None:
+            return result
+
+        # Polling gets only what's left of the timeout, not a fresh one
+        return await self._poll_until_complete(
+            tool_name, context_id, initial_response, deadline, on_format
+        )
 
     # -------------------------------------------------------------------------
 
-    def call_tool(
+    async def acall_tool(
         self,
         tool_name: str,
         input_data: Optional[Dict[str, Any]] = None,
-        wait_for_completion: bool = True
+        wait_for_completion: bool = True,
+        on_format: Optional[FormatHook] = None
     ) -> Dict[str, Any]:
         """
-        Call an MCP tool and handle async polling.
+        Call an MCP tool and handle async polling without blocking the loop.
+
+        on_format, if given, is called with each entry of the final
+        result.formats while the response is being decoded.
 
         Returns:
             Final tool result dictionary
@@ -193,35 +619,81 @@ class MCPClient:
         context_id = self._generate_context_id()
         input_data = input_data or {}
 
-        # Initial call
-        response = self._make_mcp_request(
-            tool_name=tool_name,
-            context_id=context_id,
-            input_data=input_data
-        )
+        # Bound how many calls of this tool are in flight at once
+        async with self._inflight_gate(tool_name):
 
-        # Poll if async
-        if wait_for_completion:
-            status = response.get("status", "unknown")
-            if status in ["queued", "in_progress"]:
-                response = self._poll_until_complete(
-                    tool_name, context_id, response
-                )
+            # Initial call
+            response = await self._amake_mcp_request(
+                tool_name=tool_name,
+                context_id=context_id,
+                input_data=input_data,
+                on_format=on_format
+            )
+
+            # Stream status events if the agent offers them, otherwise poll
+            if wait_for_completion:
+                status = response.get("status", "unknown")
+                if status in ["queued", "in_progress"]:
+                    if response.get("events_url"):
+                        response = await self._stream_until_complete(
+                            tool_name, context_id, response,
+                            on_format=on_format
+                        )
+                    else:
+                        response = await self._poll_until_complete(
+                            tool_name, context_id, response,
+                            on_format=on_format
+                        )
 
         return response
 
+    def call_tool(
+        self,
+        tool_name: str,
+        input_data: Optional[Dict[str, Any]] = None,
+        wait_for_completion: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Synchronous wrapper around acall_tool for non-async callers.
+
+        Returns:
+            Final tool result dictionary
+        """
+        return self._run_sync(
+            self.acall_tool(tool_name, input_data, wait_for_completion)
+        )
+
     # -------------------------------------------------------------------------
 
-    def list_creative_formats(self) -> List[Dict[str, Any]]:
-        """Fetch all creative formats via MCP."""
+    def _tag_format(self, fmt: Dict[str, Any]) -> None:
+        """Give a decoded format its agent-qualified FormatID."""
+        fmt["FormatID"] = f"{self.agent_url}/{fmt.get('id', '')}"
+
+    def invalidate_formats_cache(self) -> None:
+        """Drop the cached format list so the next call refetches it."""
+        _formats_cache.pop(self.agent_url, None)
+
+    async def alist_creative_formats(self) -> List[Dict[str, Any]]:
+        """
+        Fetch all creative formats via MCP without blocking.
+
+        Results are cached per agent_url for formats_ttl seconds; callers get
+        copies so they can't alter the cached entries.
+        """
+        cached = _formats_cache.get(self.agent_url)
+        if cached and time.monotonic() - cached[0] < self.formats_ttl:
+            return [dict(f) for f in cached[1]]
+
         try:
-            response = self.call_tool("list_creative_formats", {}, True)
+            # FormatIDs are added as each format is decoded
+            response = await self.acall_tool(
+                "list_creative_formats", {}, True, on_format=self._tag_format
+            )
 
             if response.get("status") == "completed":
                 formats = response.get("result", {}).get("formats", [])
-                for f in formats:
-                    f["FormatID"] = f"{self.agent_url}/{f.get('id', '')}"
-                return formats
+                _formats_cache[self.agent_url] = (time.monotonic(), formats)
+                return [dict(f) for f in formats]
 
             raise Exception("Listing formats failed")
 
@@ -229,10 +701,14 @@ class MCPClient:
             logger.log_error(f"Error listing creative formats: {str(e)}")
             raise
 
-    def preview_creative(self, format_id: str) -> Dict[str, Any]:
-        """Fetch preview for a given creative format."""
+    def list_creative_formats(self) -> List[Dict[str, Any]]:
+        """Fetch all creative formats via MCP."""
+        return self._run_sync(self.alist_creative_formats())
+
+    async def apreview_creative(self, format_id: str) -> Dict[str, Any]:
+        """Fetch preview for a given creative format without blocking."""
         try:
-            response = self.call_tool(
+            response = await self.acall_tool(
                 "preview_creative",
                 {"format_id": format_id},
                 True
@@ -246,3 +722,28 @@ class MCPClient:
         except Exception as e:
             logger.log_error(f"Error previewing creative: {str(e)}")
             raise
+
+    def preview_creative(self, format_id: str) -> Dict[str, Any]:
+        """Fetch preview for a given creative format."""
+        return self._run_sync(self.apreview_creative(format_id))
+
+    async def apreview_creatives(
+        self,
+        format_ids: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch previews for several formats concurrently.
+
+        All tool calls are in flight at once over the shared connection pool,
+        so the total wait is roughly that of the slowest preview.
+
+        Returns:
+            Preview dicts in the same order as format_ids
+        """
+        return list(await asyncio.gather(
+            *(self.apreview_creative(format_id) for format_id in format_ids)
+        ))
+
+    def preview_creatives(self, format_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch previews for several formats concurrently."""
+        return self._run_sync(self.apreview_creatives(format_ids))
@@ -1,145 +1,258 @@
 # mock_agent.py - Simulated MCP backend for Render deployment
-from flask import Flask, request, jsonify
+from fastapi import FastAPI, Request
+from fastapi.responses import Response, StreamingResponse
+from cachetools import TTLCache
+import orjson
 import uuid
 import os
 
-app = Flask(__name__)
-state = {}
+app = FastAPI()
+
+# Contexts are forgotten after this many seconds
+STATE_TTL = 600
+
+
+class MemoryStore:
+    """Bounded in-process context store."""
+
+    def __init__(self, maxsize=10_000, ttl=STATE_TTL):
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, context_id):
+        return self.cache.get(context_id)
+
+    async def set(self, context_id, value):
+        self.cache[context_id] = value
+
+
+class RedisStore:
+    """Context store kept as JSON in Redis, shared by all workers."""
+
+    def __init__(self, client, ttl=STATE_TTL, prefix="mcp:context:"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get(self, context_id):
+        raw = await self.client.get(self.prefix + context_id)
+        return None if raw is None else orjson.loads(raw)
+
+    async def set(self, context_id, value):
+        await self.client.set(self.prefix + context_id, orjson.dumps(value), ex=self.ttl)
+
+
+# In-process store is bounded; set REDIS_URL when running several workers.
+# Contexts are plain dicts, so write them back after every change.
+# Handlers share one event loop and never yield between reading and writing
+# an in-memory context, so it needs no lock.
+if os.environ.get("REDIS_URL"):
+    import redis.asyncio as redis
+
+    state = RedisStore(redis.from_url(os.environ["REDIS_URL"]))
+else:
+    state = MemoryStore()
 
 # The public Render URL (important!)
 BASE_URL = os.environ.get("RENDER_URL", "https://adcp-creative.onrender.com")
 
+# Tells clients how long to wait before polling a pending context again
+POLL_AFTER_MS = 100
+
+# The format catalog never changes, so encode its response once at import
+_FORMATS_JSON = orjson.dumps({
+    "status": "completed",
+    "result": {
+        "formats": [
+            {"id": "banner_300x250", "name": "300x250 Banner"},
+            {"id": "story_vertical", "name": "Vertical Story Ad"}
+        ]
+    }
+})
+
+_EMPTY_RESULT_JSON = orjson.dumps({"status": "completed", "result": {}})
+
+# Results are instant, so tools complete on the first call unless
+# SIMULATE_ASYNC is set to exercise the queued → in_progress → completed flow
+SIMULATE_ASYNC = bool(os.environ.get("SIMULATE_ASYNC"))
+
+
+def _json_response(payload, status_code=200):
+    """Build a JSON response; bytes are sent as already-encoded JSON."""
+    body = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+def _no_such_context():
+    return _json_response({"status": "failed", "error": "no such context"}, 404)
+
+
+def _bad_request():
+    return _json_response({"status": "failed", "error": "invalid JSON body"}, 400)
+
+
+def _preview_creative(inp):
+    fmt = inp.get("format_id", "unknown")
+    return orjson.dumps({
+        "status": "completed",
+        "result": {
+            "preview_url": f"mock://preview/{fmt}.png",
+            "format_id": fmt
+        }
+    })
+
+
+# Tool name → builder of its encoded completed payload
+TOOL_HANDLERS = {
+    "list_creative_formats": lambda inp: _FORMATS_JSON,
+    "preview_creative": _preview_creative,
+}
+
+
+def _finalize(tool, inp):
+    """Encode the completed payload for a tool call."""
+    handler = TOOL_HANDLERS.get(tool, lambda _: _EMPTY_RESULT_JSON)
+    return handler(inp)
+
 
 # -----------------------------------------
 # 1. DISCOVER TOOLS (REQUIRED BY MCP)
 # -----------------------------------------
-@app.route("/mcp/tools", methods=["GET"])
-def list_tools():
+@app.get("/mcp/tools")
+async def list_tools():
     """Return available MCP tools"""
-    return jsonify({
-        "tools": [
-            {"name": "list_creative_formats"},
-            {"name": "preview_creative"}
-        ]
+    return _json_response({
+        "tools": [{"name": name} for name in TOOL_HANDLERS]
     })
 
 
 # -----------------------------------------
 # 2. INVOKE TOOL (POST /mcp/tools)
 # -----------------------------------------
-@app.route("/mcp/tools", methods=["POST"])
-def tools_root():
-    payload = request.get_json(force=True)
+@app.post("/mcp/tools")
+async def tools_root(request: Request):
+    try:
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        return _bad_request()
+    if not isinstance(payload, dict):
+        return _bad_request()
+
     tool = payload.get("tool_name")
     context_id = payload.get("context_id") or str(uuid.uuid4())
     inp = payload.get("input", {})
 
+    # Nothing to wait for → answer straight away without tracking a context
+    if not SIMULATE_ASYNC and tool in TOOL_HANDLERS:
+        return _json_response(_finalize(tool, inp))
+
+    s = await state.get(context_id)
+
     # First step → queued
-    if context_id not in state:
-        state[context_id] = {"step": 0, "tool": tool, "input": inp}
+    if s is None:
+        await state.set(context_id, {"step": 0, "tool": tool, "input": inp})
 
-        return jsonify({
+        return _json_response({
             "status": "queued",
             "operation_url": f"{BASE_URL}/mcp/tools/{context_id}",
-            "context_id": context_id
+            "events_url": f"{BASE_URL}/mcp/tools/{context_id}/events",
+            "context_id": context_id,
+            "poll_after_ms": POLL_AFTER_MS
         })
 
     # Progress workflow
-    s = state[context_id]
-
     if s["step"] == 0:
         s["step"] = 1
-        return jsonify({
+        await state.set(context_id, s)
+        return _json_response({
             "status": "in_progress",
             "operation_url": f"{BASE_URL}/mcp/tools/{context_id}",
-            "context_id": context_id
+            "events_url": f"{BASE_URL}/mcp/tools/{context_id}/events",
+            "context_id": context_id,
+            "poll_after_ms": POLL_AFTER_MS
         })
 
     elif s["step"] == 1:
         s["step"] = 2
-
-        if s["tool"] == "list_creative_formats":
-            return jsonify({
-                "status": "completed",
-                "result": {
-                    "formats": [
-                        {"id": "banner_300x250", "name": "300x250 Banner"},
-                        {"id": "story_vertical", "name": "Vertical Story Ad"}
-                    ]
-                }
-            })
-
-        elif s["tool"] == "preview_creative":
-            fmt = s["input"].get("format_id", "unknown")
-            return jsonify({
-                "status": "completed",
-                "result": {
-                    "preview_url": f"mock://preview/{fmt}.png",
-                    "format_id": fmt
-                }
-            })
-
-        else:
-            return jsonify({"status": "completed", "result": {}})
+        await state.set(context_id, s)
+        return _json_response(_finalize(s["tool"], s["input"]))
 
     else:
-        return jsonify({"status": "completed", "result": {}})
+        return _json_response(_EMPTY_RESULT_JSON)
 
 
 # -----------------------------------------
 # 3. POLLING ENDPOINT
 # -----------------------------------------
-@app.route("/mcp/tools/<context_id>", methods=["GET"])
-def tools_poll(context_id):
-    s = state.get(context_id)
-    if not s:
-        return jsonify({"status": "failed", "error": "no such context"}), 404
+async def _advance(context_id, s):
+    """
+    Move a context one step along.
 
+    Returns (done, body) where body is the encoded status payload.
+    """
     # Step 0 → queued
     if s["step"] == 0:
         s["step"] = 1
-        return jsonify({
+        await state.set(context_id, s)
+        return False, orjson.dumps({
             "status": "queued",
-            "operation_url": f"{BASE_URL}/mcp/tools/{context_id}"
+            "operation_url": f"{BASE_URL}/mcp/tools/{context_id}",
+            "poll_after_ms": POLL_AFTER_MS
         })
 
     # Step 1 → in progress
     elif s["step"] == 1:
         s["step"] = 2
-        return jsonify({
+        await state.set(context_id, s)
+        return False, orjson.dumps({
             "status": "in_progress",
-            "operation_url": f"{BASE_URL}/mcp/tools/{context_id}"
+            "operation_url": f"{BASE_URL}/mcp/tools/{context_id}",
+            "poll_after_ms": POLL_AFTER_MS
         })
 
     # Step 2 → completed
     else:
-        if s["tool"] == "list_creative_formats":
-            return jsonify({
-                "status": "completed",
-                "result": {
-                    "formats": [
-                        {"id": "banner_300x250", "name": "300x250 Banner"},
-                        {"id": "story_vertical", "name": "Vertical Story Ad"}
-                    ]
-                }
-            })
-
-        elif s["tool"] == "preview_creative":
-            fmt = s["input"].get("format_id", "unknown")
-            return jsonify({
-                "status": "completed",
-                "result": {
-                    "preview_url": f"mock://preview/{fmt}.png",
-                    "format_id": fmt
-                }
-            })
-
-        return jsonify({"status": "completed", "result": {}})
+        return True, _finalize(s["tool"], s["input"])
+
+
+@app.get("/mcp/tools/{context_id}")
+async def tools_poll(context_id: str):
+    s = await state.get(context_id)
+    if s is None:
+        return _no_such_context()
+
+    _, body = await _advance(context_id, s)
+    return _json_response(body)
+
+
+# -----------------------------------------
+# 4. EVENT STREAM (SSE alternative to polling)
+# -----------------------------------------
+@app.get("/mcp/tools/{context_id}/events")
+async def tools_events(context_id: str):
+    s = await state.get(context_id)
+    if s is None:
+        return _no_such_context()
+
+    async def generate():
+        # Push every status change on one connection until completed
+        while True:
+            done, body = await _advance(context_id, s)
+            yield b"data: " + body + b"\n\n"
+            if done:
+                break
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
 
 
 # -----------------------------------------
 # RUN SERVER
 # -----------------------------------------
 if __name__ == "__main__":
+    import uvicorn
+
     PORT = int(os.environ.get("PORT", "8000"))
-    app.run(host="0.0.0.0", port=PORT)
+    uvicorn.run(app, host="0.0.0.0", port=PORT)